@@ -1,7 +1,13 @@
 """
 DNA sequence analysis module
 """
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+import encoding
+import fused
+
 
 def count_nucleotides(sequence: str) -> dict:
     """
@@ -13,12 +19,12 @@ def count_nucleotides(sequence: str) -> dict:
     Returns:
         Dictionary with counts for A, T, C, G
     """
-    sequence = sequence.upper()
+    histogram = np.bincount(encoding.encode_2bit(sequence), minlength=4)
     return {
-        'A': sequence.count('A'),
-        'T': sequence.count('T'),
-        'C': sequence.count('C'),
-        'G': sequence.count('G')
+        'A': int(histogram[encoding.BASE_A]),
+        'T': int(histogram[encoding.BASE_T]),
+        'C': int(histogram[encoding.BASE_C]),
+        'G': int(histogram[encoding.BASE_G])
     }
 
 
@@ -32,9 +38,10 @@ def calculate_percentages(sequence: str) -> dict:
     Returns:
         Dictionary with gc_percent and at_percent
     """
-    counts = count_nucleotides(sequence)
-    total = len(sequence)
+    return _percentages_from_counts(count_nucleotides(sequence), len(sequence))
 
+
+def _percentages_from_counts(counts: dict, total: int) -> dict:
     if total == 0:
         return {'gc_percent': 0.0, 'at_percent': 0.0}
 
@@ -47,6 +54,9 @@ def calculate_percentages(sequence: str) -> dict:
     }
 
 
+_COMPLEMENT_TABLE = bytes.maketrans(b'ATCGatcg', b'TAGCTAGC')
+
+
 def reverse_complement(sequence: str) -> str:
     """
     Generate the reverse complement of a DNA sequence
@@ -57,16 +67,8 @@ def reverse_complement(sequence: str) -> str:
     Returns:
         Reverse complement sequence
     """
-    complement_map = {
-        'A': 'T',
-        'T': 'A',
-        'C': 'G',
-        'G': 'C'
-    }
-
-    sequence = sequence.upper()
-    complement = ''.join(complement_map[base] for base in sequence)
-    return complement[::-1]
+    complement = sequence.encode('ascii').translate(_COMPLEMENT_TABLE)
+    return complement[::-1].decode('ascii')
 
 
 def split_into_codons(sequence: str) -> List[str]:
@@ -79,15 +81,21 @@ def split_into_codons(sequence: str) -> List[str]:
     Returns:
         List of codon strings
     """
-    sequence = sequence.upper()
-    codons = []
+    buf = sequence.encode('ascii')
+    usable = len(buf) - len(buf) % 3
+    return np.frombuffer(buf[:usable], dtype='S3').astype('U3').tolist()
 
-    for i in range(0, len(sequence), 3):
-        codon = sequence[i:i+3]
-        if len(codon) == 3:
-            codons.append(codon)
 
-    return codons
+def _find_all(data: bytes, pattern: bytes) -> List[int]:
+    """
+    All (overlapping) positions of pattern in data via bytes.find
+    """
+    positions = []
+    i = data.find(pattern)
+    while i != -1:
+        positions.append(i)
+        i = data.find(pattern, i + 1)
+    return positions
 
 
 def find_start_stop_codons(sequence: str) -> dict:
@@ -100,26 +108,34 @@ def find_start_stop_codons(sequence: str) -> dict:
     Returns:
         Dictionary with lists of start and stop codon positions
     """
-    sequence = sequence.upper()
-    start_codon = 'ATG'
-    stop_codons = {'TAA', 'TAG', 'TGA'}
+    data = sequence.encode('ascii')
 
-    start_positions = []
-    stop_positions = []
-
-    for i in range(0, len(sequence) - 2):
-        codon = sequence[i:i+3]
-        if codon == start_codon:
-            start_positions.append(i)
-        elif codon in stop_codons:
-            stop_positions.append({'position': i, 'codon': codon})
+    start_positions = _find_all(data, b'ATG')
+    stop_positions = sorted(
+        (position, codon)
+        for pattern, codon in _STOP_PATTERNS
+        for position in _find_all(data, pattern)
+    )
 
     return {
         'start_codons': start_positions,
-        'stop_codons': stop_positions
+        'stop_codons': [
+            {'position': position, 'codon': codon}
+            for position, codon in stop_positions
+        ]
     }
 
 
+STOP_CODONS = ('TAA', 'TAG', 'TGA')
+
+_ATG_ID = encoding.codon_id('ATG')
+_STOP_IDS = np.array(
+    [encoding.codon_id(codon) for codon in STOP_CODONS],
+    dtype=np.uint8
+)
+_STOP_PATTERNS = tuple((codon.encode('ascii'), codon) for codon in STOP_CODONS)
+
+
 def detect_orfs(sequence: str) -> List[dict]:
     """
     Detect Open Reading Frames (ORFs) in the sequence
@@ -131,58 +147,86 @@ def detect_orfs(sequence: str) -> List[dict]:
     Returns:
         List of ORF dictionaries with start, end, length, and sequence
     """
-    sequence = sequence.upper()
-    stop_codons = {'TAA', 'TAG', 'TGA'}
+    codes = encoding.encode_2bit(sequence)
+    all_ids = encoding.sliding_codon_ids(codes)
+
+    # Locate every start/stop event once across all frames, then pair
+    # them frame by frame with an O(events) sweep: each ATG takes the
+    # first in-frame stop after it, and scanning resumes past that stop
+    start_positions = np.flatnonzero(all_ids == _ATG_ID)
+    stop_positions = np.flatnonzero(np.isin(all_ids, _STOP_IDS))
+
     orfs = []
 
     for frame in range(3):
-        i = frame
-        while i < len(sequence) - 2:
-            codon = sequence[i:i+3]
-
-            if codon == 'ATG':
-                start = i
-                j = i + 3
-
-                while j < len(sequence) - 2:
-                    stop_codon = sequence[j:j+3]
-                    if stop_codon in stop_codons:
-                        end = j + 3
-                        orf_sequence = sequence[start:end]
-                        orfs.append({
-                            'frame': frame,
-                            'start': start,
-                            'end': end,
-                            'length': len(orf_sequence),
-                            'sequence': orf_sequence
-                        })
-                        i = j + 3
-                        break
-                    j += 3
-                else:
-                    i += 3
-            else:
-                i += 3
+        frame_starts = start_positions[start_positions % 3 == frame]
+        frame_stops = stop_positions[stop_positions % 3 == frame]
+
+        resume = frame
+        stop_index = 0
+        for atg in frame_starts:
+            if atg < resume:
+                continue
+            while stop_index < len(frame_stops) and frame_stops[stop_index] < atg + 3:
+                stop_index += 1
+            if stop_index == len(frame_stops):
+                break
+            start = int(atg)
+            end = int(frame_stops[stop_index]) + 3
+            orfs.append({
+                'frame': frame,
+                'start': start,
+                'end': end,
+                'length': end - start,
+                'sequence': sequence[start:end]
+            })
+            resume = end
 
     return orfs
 
 
-def analyze_sequence(sequence: str) -> dict:
+def analyze_sequence(sequence: str, include: Optional[Set[str]] = None) -> dict:
     """
-    Perform complete analysis on a DNA sequence
+    Perform analysis on a DNA sequence
 
     Args:
         sequence: DNA sequence string
+        include: result groups to add beyond the length/counts/percent
+            summary ('rc', 'codons', 'orfs'); None includes everything
 
     Returns:
-        Dictionary with all analysis results
+        Dictionary with the requested analysis results
     """
-    return {
+    want_orfs = include is None or 'orfs' in include
+
+    if not want_orfs:
+        # Summary only: a bincount pass covers the counts without
+        # building the start/stop and ORF event structures
+        counts = count_nucleotides(sequence)
+        start_stop = None
+        orfs = None
+    elif fused.NUMBA_AVAILABLE:
+        scanned = fused.fused_scan(sequence)
+        counts = scanned['nucleotide_counts']
+        start_stop = scanned['start_stop_codons']
+        orfs = scanned['orfs']
+    else:
+        counts = count_nucleotides(sequence)
+        start_stop = find_start_stop_codons(sequence)
+        orfs = detect_orfs(sequence)
+
+    results = {
         'length': len(sequence),
-        'nucleotide_counts': count_nucleotides(sequence),
-        'percentages': calculate_percentages(sequence),
-        'reverse_complement': reverse_complement(sequence),
-        'codons': split_into_codons(sequence),
-        'start_stop_codons': find_start_stop_codons(sequence),
-        'orfs': detect_orfs(sequence)
+        'nucleotide_counts': counts,
+        'percentages': _percentages_from_counts(counts, len(sequence))
     }
+
+    if include is None or 'rc' in include:
+        results['reverse_complement'] = reverse_complement(sequence)
+    if include is None or 'codons' in include:
+        results['codons'] = split_into_codons(sequence)
+    if want_orfs:
+        results['start_stop_codons'] = start_stop
+        results['orfs'] = orfs
+
+    return results
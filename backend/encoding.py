@@ -0,0 +1,84 @@
+"""
+Canonical 2-bit DNA encoding shared by the analysis and translation modules
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Bits 1-2 of the ASCII codes are distinct across A/C/G/T, so a shift and
+# mask encode a base without any lookup table: A=0, C=1, T=2, G=3
+BASE_A = 0
+BASE_C = 1
+BASE_T = 2
+BASE_G = 3
+
+
+# Codon string for each 6-bit codon id (index i of 'ACTG' is the base
+# whose 2-bit code is i)
+ID_TO_CODON = [
+    'ACTG'[(i >> 4) & 3] + 'ACTG'[(i >> 2) & 3] + 'ACTG'[i & 3]
+    for i in range(64)
+]
+
+
+@lru_cache(maxsize=16)
+def encode_2bit(sequence: str) -> np.ndarray:
+    """
+    Encode an uppercase DNA sequence as one 2-bit code per base
+
+    Computed once per sequence (cached), so every analysis step that
+    needs the numeric form shares a single encoding pass.
+
+    Args:
+        sequence: validated uppercase DNA sequence
+
+    Returns:
+        Read-only uint8 array with A=0, C=1, T=2, G=3
+    """
+    ascii_codes = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+    codes = (ascii_codes >> 1) & 3
+    codes.flags.writeable = False
+    return codes
+
+
+def codon_id(codon: str) -> int:
+    """
+    Pack a 3-base codon string into its 6-bit codon id
+    """
+    first, second, third = ((ord(base) >> 1) & 3 for base in codon)
+    return (first << 4) | (second << 2) | third
+
+
+def sliding_codon_ids(codes: np.ndarray) -> np.ndarray:
+    """
+    Branchless codon ids for every position of the sequence
+
+    Three shifted views combined with shift/or — no per-codon branching
+    or reshaping — giving the id of the codon starting at each base.
+
+    Args:
+        codes: 2-bit code array from encode_2bit
+
+    Returns:
+        uint8 array of length len(codes) - 2 (empty if shorter)
+    """
+    if codes.shape[0] < 3:
+        return np.empty(0, dtype=np.uint8)
+    return (codes[:-2] << 4) | (codes[1:-1] << 2) | codes[2:]
+
+
+def codon_ids(codes: np.ndarray, frame: int = 0) -> np.ndarray:
+    """
+    Pack consecutive base codes into 6-bit codon ids for a reading frame
+
+    Args:
+        codes: 2-bit code array from encode_2bit
+        frame: reading frame offset (0, 1 or 2)
+
+    Returns:
+        uint8 array with one codon id per complete triplet
+    """
+    in_frame = codes[frame:]
+    usable = len(in_frame) - len(in_frame) % 3
+    triplets = in_frame[:usable].reshape(-1, 3)
+    return (triplets[:, 0] << 4) | (triplets[:, 1] << 2) | triplets[:, 2]
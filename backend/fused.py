@@ -0,0 +1,127 @@
+"""
+Single-pass fused analysis kernel (optional numba acceleration)
+
+Scans the 2-bit encoded sequence once, producing nucleotide counts and
+every start/stop codon position in one sweep instead of the separate
+passes made by count_nucleotides, find_start_stop_codons and
+detect_orfs. Falls back transparently when numba is not installed.
+"""
+import numpy as np
+
+import encoding
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_ATG_ID = encoding.codon_id('ATG')
+
+# 64-bit bitmask with one bit set per stop codon id, so the kernel
+# tests stop membership with a shift instead of comparisons
+_STOP_ID_MASK = (
+    (1 << encoding.codon_id('TAA')) |
+    (1 << encoding.codon_id('TAG')) |
+    (1 << encoding.codon_id('TGA'))
+)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan(codes):
+        """
+        One streaming pass: per-base counts plus every sliding-window
+        ATG and stop codon position, via a rolling 6-bit codon id
+        """
+        n = codes.shape[0]
+        counts = np.zeros(4, dtype=np.int64)
+        starts = np.empty(n, dtype=np.int64)
+        stops = np.empty(n, dtype=np.int64)
+        stop_ids = np.empty(n, dtype=np.uint8)
+        n_starts = 0
+        n_stops = 0
+        rolling = 0
+
+        for i in range(n):
+            code = codes[i]
+            counts[code] += 1
+            rolling = ((rolling << 2) | code) & 0x3F
+            if i >= 2:
+                if rolling == _ATG_ID:
+                    starts[n_starts] = i - 2
+                    n_starts += 1
+                elif (_STOP_ID_MASK >> rolling) & 1:
+                    stops[n_stops] = i - 2
+                    stop_ids[n_stops] = rolling
+                    n_stops += 1
+
+        return counts, starts[:n_starts], stops[:n_stops], stop_ids[:n_stops]
+
+    # Warm the JIT at import so the first request does not pay
+    # compilation latency
+    _scan(np.zeros(3, dtype=np.uint8))
+
+
+def _pair_orfs(starts, stops, sequence):
+    """
+    Pair start and stop events into ORFs, frame by frame, matching the
+    scan order of detect_orfs: first in-frame stop after each ATG, then
+    resume after that stop
+    """
+    orfs = []
+
+    for frame in range(3):
+        frame_starts = [p for p in starts if p % 3 == frame]
+        frame_stops = [p for p in stops if p % 3 == frame]
+
+        resume = frame
+        stop_index = 0
+        for atg in frame_starts:
+            if atg < resume:
+                continue
+            while stop_index < len(frame_stops) and frame_stops[stop_index] < atg + 3:
+                stop_index += 1
+            if stop_index == len(frame_stops):
+                break
+            end = frame_stops[stop_index] + 3
+            orfs.append({
+                'frame': frame,
+                'start': atg,
+                'end': end,
+                'length': end - atg,
+                'sequence': sequence[atg:end]
+            })
+            resume = end
+
+    # detect_orfs emits frame 0 ORFs first, then frame 1, then frame 2;
+    # the per-frame loop above already preserves that ordering
+    return orfs
+
+
+def fused_scan(sequence: str) -> dict:
+    """
+    Run the fused kernel over a validated uppercase sequence
+
+    Returns:
+        Dictionary with nucleotide_counts, start_stop_codons and orfs
+        in the same schemas as the individual analysis functions
+    """
+    codes = encoding.encode_2bit(sequence)
+    counts, starts, stops, stop_ids = _scan(codes)
+
+    return {
+        'nucleotide_counts': {
+            'A': int(counts[encoding.BASE_A]),
+            'T': int(counts[encoding.BASE_T]),
+            'C': int(counts[encoding.BASE_C]),
+            'G': int(counts[encoding.BASE_G])
+        },
+        'start_stop_codons': {
+            'start_codons': [int(p) for p in starts],
+            'stop_codons': [
+                {'position': int(p), 'codon': encoding.ID_TO_CODON[cid]}
+                for p, cid in zip(stops, stop_ids)
+            ]
+        },
+        'orfs': _pair_orfs(starts.tolist(), stops.tolist(), sequence)
+    }
@@ -1,17 +1,91 @@
 """
 FastAPI backend for bioinformatics DNA sequence analysis
 """
-from fastapi import FastAPI, HTTPException, UploadFile, File
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Set
 
 import validation
 import analysis
 import translation
 import mutation
 
-app = FastAPI(title="Bioinformatics DNA Analysis API")
+# Result groups /analyze can be asked for beyond the default summary
+INCLUDE_GROUPS = {'rc', 'codons', 'orfs', 'translation'}
+
+
+class AnalysisCache:
+    """
+    LRU cache for /analyze results keyed by sequence digest, evicted by
+    total cached sequence bytes rather than entry count so a handful of
+    chromosome-sized entries cannot pin unbounded memory
+    """
+
+    def __init__(self, max_bytes: int):
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, size: int):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = (value, size)
+        self._total_bytes += size
+        while self._total_bytes > self._max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+
+
+_analysis_cache = AnalysisCache(max_bytes=64 * 1024 * 1024)
+
+
+def _run_full_analysis(sequence: str, include: Set[str]) -> dict:
+    """
+    CPU-bound analysis pipeline, run in a worker process so large
+    sequences do not block the event loop
+    """
+    include = INCLUDE_GROUPS if 'all' in include else include
+    results = {"analysis": analysis.analyze_sequence(sequence, include)}
+
+    if 'orfs' in include:
+        results["translated_orfs"] = translation.translate_orfs(
+            results["analysis"]['orfs']
+        )
+    if 'translation' in include:
+        results["full_translation"] = translation.translate_dna_cached(sequence)
+
+    return results
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    yield
+    app.state.pool.shutdown()
+
+
+app = FastAPI(
+    title="Bioinformatics DNA Analysis API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -44,18 +118,21 @@ def read_root():
 
 
 @app.post("/analyze")
-def analyze_dna_sequence(input_data: FASTAInput):
+async def analyze_dna_sequence(
+    input_data: FASTAInput,
+    include: Set[str] = Query(default={'summary'})
+):
     """
     Analyze a single DNA sequence in FASTA format
 
-    Returns:
-        - Sequence information
-        - Nucleotide counts and percentages
-        - Reverse complement
-        - Codons
-        - Start/stop codons
-        - ORFs
-        - Translation
+    Always returns length, nucleotide counts and percentages; heavier
+    result groups are opt-in via ?include= so large sequences do not
+    serialize data the client will not use:
+        - rc: reverse complement
+        - codons: codon list
+        - orfs: start/stop codons, ORFs and their translations
+        - translation: full frame-0 translation
+        - all: everything above
     """
     try:
         parsed = validation.validate_fasta_dna(input_data.fasta_text)
@@ -63,20 +140,25 @@ def analyze_dna_sequence(input_data: FASTAInput):
         sequence = parsed['sequence']
         header = parsed['header']
 
-        analysis_results = analysis.analyze_sequence(sequence)
-
-        orfs = analysis_results['orfs']
-        translated_orfs = translation.translate_orfs(orfs)
-
-        full_translation = translation.translate_dna(sequence)
+        # Re-posting the same FASTA (common during UI iteration) hits
+        # the cache instead of redoing the analysis
+        cache_key = (
+            hashlib.sha256(sequence.encode('ascii')).digest(),
+            frozenset(include)
+        )
+        results = _analysis_cache.get(cache_key)
+        if results is None:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                app.state.pool, _run_full_analysis, sequence, include
+            )
+            _analysis_cache.put(cache_key, results, len(sequence))
 
         return {
             "success": True,
             "header": header,
             "sequence": sequence,
-            "analysis": analysis_results,
-            "translated_orfs": translated_orfs,
-            "full_translation": full_translation
+            **results
         }
 
     except ValueError as e:
@@ -86,10 +168,14 @@ def analyze_dna_sequence(input_data: FASTAInput):
 
 
 @app.post("/compare")
-def compare_dna_sequences(input_data: TwoSequenceInput):
+def compare_dna_sequences(input_data: TwoSequenceInput, verbose: bool = Query(default=True)):
     """
     Compare two DNA sequences in FASTA format
 
+    With verbose=false, equal-length comparisons return compact
+    mutation arrays (positions plus reference/variant bases) instead of
+    one dictionary per mutation
+
     Returns:
         - Alignment visualization
         - Mutation detection and classification
@@ -104,7 +190,7 @@ def compare_dna_sequences(input_data: TwoSequenceInput):
         header1 = parsed1['header']
         header2 = parsed2['header']
 
-        comparison_results = mutation.compare_sequences(seq1, seq2)
+        comparison_results = mutation.compare_sequences(seq1, seq2, verbose)
 
         return {
             "success": True,
@@ -131,17 +217,21 @@ async def upload_fasta_file(file: UploadFile = File(...)):
     Upload a FASTA file and return its contents
     """
     try:
-        contents = await file.read()
-        fasta_text = contents.decode('utf-8')
+        # Stream the body in chunks instead of buffering it with one
+        # read, and parse the raw bytes without an upfront str decode
+        buffer = bytearray()
+        while chunk := await file.read(1024 * 1024):
+            buffer += chunk
+        contents = bytes(buffer)
 
-        parsed = validation.validate_fasta_dna(fasta_text)
+        parsed = validation.validate_fasta_dna_bytes(contents)
 
         return {
             "success": True,
             "filename": file.filename,
             "header": parsed['header'],
             "sequence": parsed['sequence'],
-            "fasta_text": fasta_text
+            "fasta_text": contents.decode('utf-8', 'replace')
         }
 
     except ValueError as e:
@@ -2,91 +2,215 @@
 DNA sequence comparison and mutation detection module
 """
 from typing import List, Tuple
-from translation import translate_dna
 
+import numpy as np
 
-def align_sequences(seq1: str, seq2: str) -> dict:
+from translation import translate_dna_cached
+
+try:
+    import parasail
+    PARASAIL_AVAILABLE = True
+except ImportError:
+    PARASAIL_AVAILABLE = False
+
+_GAP_OPEN = 10
+_GAP_EXTEND = 1
+
+
+def _find_substitutions(seq1: str, seq2: str, length: int) -> Tuple[str, List[int], str, str]:
     """
-    Simple pairwise alignment of two DNA sequences
-    Detects substitutions, insertions, and deletions
+    Compare the first `length` bases of both sequences with a vectorized
+    mismatch mask
+
+    Returns:
+        Alignment string ('|' match, '*' mismatch), mismatch positions,
+        and the reference/variant bases at those positions
+    """
+    reference = np.frombuffer(seq1.encode('ascii'), dtype=np.uint8)[:length]
+    variant = np.frombuffer(seq2.encode('ascii'), dtype=np.uint8)[:length]
+    mismatch = reference != variant
+
+    alignment = np.full(length, ord('|'), dtype=np.uint8)
+    alignment[mismatch] = ord('*')
+
+    positions = np.flatnonzero(mismatch)
+
+    return (
+        alignment.tobytes().decode('ascii'),
+        positions.tolist(),
+        reference[positions].tobytes().decode('ascii'),
+        variant[positions].tobytes().decode('ascii')
+    )
+
+
+def _substitution_dicts(positions: List[int], references: str, variants: str) -> List[dict]:
+    """
+    Expand compact substitution arrays into per-mutation dictionaries
+    """
+    return [
+        {
+            'type': 'substitution',
+            'position': position,
+            'reference': reference,
+            'variant': variant
+        }
+        for position, reference, variant in zip(positions, references, variants)
+    ]
+
+
+def _align_with_parasail(seq1: str, seq2: str) -> dict:
+    """
+    Align two sequences with parasail's striped SIMD global aligner and
+    convert the gapped traceback into the mutation schema
 
     Args:
         seq1: First DNA sequence (reference)
         seq2: Second DNA sequence (variant)
 
     Returns:
-        Dictionary with alignment information and mutations
+        Dictionary with alignment information and mutations; seq1/seq2
+        are the gapped aligned strings so they line up column-for-column
+        with the alignment string
     """
-    seq1 = seq1.upper()
-    seq2 = seq2.upper()
-
-    len1 = len(seq1)
-    len2 = len(seq2)
+    result = parasail.nw_trace_striped_16(
+        seq2, seq1, _GAP_OPEN, _GAP_EXTEND, parasail.dnafull
+    )
+    if result.saturated:
+        # 16-bit lanes overflow around ~6.5 kb of matching dnafull
+        # scores; retry with 32-bit lanes before trusting the traceback
+        result = parasail.nw_trace_striped_32(
+            seq2, seq1, _GAP_OPEN, _GAP_EXTEND, parasail.dnafull
+        )
+    aligned_ref = result.traceback.ref
+    aligned_var = result.traceback.query
 
     mutations = []
-    alignment_string = []
-
-    if len1 == len2:
-        for i in range(len1):
-            if seq1[i] == seq2[i]:
-                alignment_string.append('|')
+    alignment_chars = []
+    ref_position = 0
+    i = 0
+    columns = len(aligned_ref)
+
+    while i < columns:
+        if aligned_ref[i] == '-':
+            j = i
+            while j < columns and aligned_ref[j] == '-':
+                j += 1
+            mutations.append({
+                'type': 'insertion',
+                'position': ref_position,
+                'length': j - i,
+                'sequence': aligned_var[i:j]
+            })
+            alignment_chars.append(' ' * (j - i))
+            i = j
+        elif aligned_var[i] == '-':
+            j = i
+            while j < columns and aligned_var[j] == '-':
+                j += 1
+            mutations.append({
+                'type': 'deletion',
+                'position': ref_position,
+                'length': j - i,
+                'sequence': aligned_ref[i:j]
+            })
+            alignment_chars.append(' ' * (j - i))
+            ref_position += j - i
+            i = j
+        else:
+            if aligned_ref[i] == aligned_var[i]:
+                alignment_chars.append('|')
             else:
-                alignment_string.append('*')
+                alignment_chars.append('*')
                 mutations.append({
                     'type': 'substitution',
-                    'position': i,
-                    'reference': seq1[i],
-                    'variant': seq2[i]
+                    'position': ref_position,
+                    'reference': aligned_ref[i],
+                    'variant': aligned_var[i]
                 })
-    else:
-        length_diff = abs(len1 - len2)
+            ref_position += 1
+            i += 1
 
-        if len1 < len2:
-            mutations.append({
-                'type': 'insertion',
-                'position': len1,
-                'length': length_diff,
-                'sequence': seq2[len1:]
-            })
+    return {
+        'seq1': aligned_ref,
+        'seq2': aligned_var,
+        'alignment': ''.join(alignment_chars),
+        'mutations': mutations,
+        'mutation_count': len(mutations),
+        'length_seq1': len(seq1),
+        'length_seq2': len(seq2)
+    }
 
-            for i in range(len1):
-                if seq1[i] == seq2[i]:
-                    alignment_string.append('|')
-                else:
-                    alignment_string.append('*')
-                    mutations.append({
-                        'type': 'substitution',
-                        'position': i,
-                        'reference': seq1[i],
-                        'variant': seq2[i]
-                    })
 
-            alignment_string.extend([' '] * length_diff)
+def align_sequences(seq1: str, seq2: str, verbose: bool = True) -> dict:
+    """
+    Pairwise alignment of two DNA sequences
+    Detects substitutions, insertions, and deletions
 
-        else:
-            mutations.append({
-                'type': 'deletion',
-                'position': len2,
-                'length': length_diff,
-                'sequence': seq1[len2:]
-            })
+    Equal-length sequences use a vectorized position-by-position
+    comparison; unequal lengths use a SIMD global alignment (parasail)
+    so indels are localized instead of lumped at the shorter end
 
-            for i in range(len2):
-                if seq1[i] == seq2[i]:
-                    alignment_string.append('|')
-                else:
-                    alignment_string.append('*')
-                    mutations.append({
-                        'type': 'substitution',
-                        'position': i,
-                        'reference': seq1[i],
-                        'variant': seq2[i]
-                    })
+    Args:
+        seq1: First DNA sequence (reference)
+        seq2: Second DNA sequence (variant)
+        verbose: include the per-mutation dictionary list; with False,
+            equal-length comparisons return only the compact
+            positions/bases arrays, which is much smaller JSON for
+            dense variant sets
+
+    Returns:
+        Dictionary with alignment information and mutations
+    """
+    len1 = len(seq1)
+    len2 = len(seq2)
+
+    if len1 == len2:
+        alignment, positions, references, variants = _find_substitutions(seq1, seq2, len1)
+        result = {
+            'seq1': seq1,
+            'seq2': seq2,
+            'alignment': alignment,
+            'mutation_positions': positions,
+            'reference_bases': references,
+            'variant_bases': variants,
+            'mutation_count': len(positions),
+            'length_seq1': len1,
+            'length_seq2': len2
+        }
+        if verbose:
+            result['mutations'] = _substitution_dicts(positions, references, variants)
+        return result
+
+    if PARASAIL_AVAILABLE and len1 and len2:
+        return _align_with_parasail(seq1, seq2)
+
+    mutations = []
+    length_diff = abs(len1 - len2)
+
+    if len1 < len2:
+        mutations.append({
+            'type': 'insertion',
+            'position': len1,
+            'length': length_diff,
+            'sequence': seq2[len1:]
+        })
+        alignment, positions, references, variants = _find_substitutions(seq1, seq2, len1)
+        mutations.extend(_substitution_dicts(positions, references, variants))
+        alignment += ' ' * length_diff
+    else:
+        mutations.append({
+            'type': 'deletion',
+            'position': len2,
+            'length': length_diff,
+            'sequence': seq1[len2:]
+        })
+        alignment, positions, references, variants = _find_substitutions(seq1, seq2, len2)
+        mutations.extend(_substitution_dicts(positions, references, variants))
 
     return {
         'seq1': seq1,
         'seq2': seq2,
-        'alignment': ''.join(alignment_string),
+        'alignment': alignment,
         'mutations': mutations,
         'mutation_count': len(mutations),
         'length_seq1': len1,
@@ -133,8 +257,8 @@ def compare_proteins(seq1: str, seq2: str) -> dict:
     Returns:
         Dictionary with protein comparison
     """
-    protein1 = translate_dna(seq1)
-    protein2 = translate_dna(seq2)
+    protein1 = translate_dna_cached(seq1)
+    protein2 = translate_dna_cached(seq2)
 
     prot_seq1 = protein1['protein']
     prot_seq2 = protein2['protein']
@@ -174,19 +298,28 @@ def compare_proteins(seq1: str, seq2: str) -> dict:
     }
 
 
-def compare_sequences(seq1: str, seq2: str) -> dict:
+def compare_sequences(seq1: str, seq2: str, verbose: bool = True) -> dict:
     """
     Complete comparison of two DNA sequences
 
     Args:
         seq1: First DNA sequence (reference)
         seq2: Second DNA sequence (variant)
+        verbose: include per-mutation dictionaries in the alignment
 
     Returns:
         Dictionary with complete comparison results
     """
-    alignment = align_sequences(seq1, seq2)
-    mutation_classification = classify_mutations(alignment['mutations'])
+    alignment = align_sequences(seq1, seq2, verbose)
+    if 'mutations' in alignment:
+        mutation_classification = classify_mutations(alignment['mutations'])
+    else:
+        # Compact equal-length result: every mutation is a substitution
+        mutation_classification = {
+            'substitutions': alignment['mutation_count'],
+            'insertions': 0,
+            'deletions': 0
+        }
     protein_comparison = compare_proteins(seq1, seq2)
 
     return {
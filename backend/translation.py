@@ -1,6 +1,11 @@
 """
 DNA to protein translation module using the standard genetic code
 """
+from functools import lru_cache
+
+import numpy as np
+
+import encoding
 
 GENETIC_CODE = {
     'TTT': 'F', 'TTC': 'F', 'TTA': 'L', 'TTG': 'L',
@@ -22,6 +27,14 @@ GENETIC_CODE = {
 }
 
 
+# Amino acid for each 6-bit codon id, so bulk translation is a single
+# vectorized gather instead of per-codon dict lookups
+_AA_LUT = np.array(
+    [GENETIC_CODE[codon] for codon in encoding.ID_TO_CODON],
+    dtype='S1'
+)
+
+
 def translate_codon(codon: str) -> str:
     """
     Translate a single codon to amino acid
@@ -32,7 +45,6 @@ def translate_codon(codon: str) -> str:
     Returns:
         Single letter amino acid code or '*' for stop codon
     """
-    codon = codon.upper()
     if len(codon) != 3:
         return '?'
     return GENETIC_CODE.get(codon, '?')
@@ -49,39 +61,51 @@ def translate_dna(sequence: str, start_position: int = 0) -> dict:
     Returns:
         Dictionary with protein sequence and codon mapping
     """
-    sequence = sequence.upper()
-
     if start_position >= len(sequence):
         return {'protein': '', 'codons': [], 'codon_map': []}
 
     sequence = sequence[start_position:]
 
-    protein = []
-    codons = []
-    codon_map = []
-
-    for i in range(0, len(sequence) - 2, 3):
-        codon = sequence[i:i+3]
-        if len(codon) == 3:
-            amino_acid = translate_codon(codon)
-            codons.append(codon)
-            protein.append(amino_acid)
-            codon_map.append({
-                'codon': codon,
-                'amino_acid': amino_acid,
-                'position': i
-            })
-
-            if amino_acid == '*':
-                break
+    codon_ids = encoding.codon_ids(encoding.encode_2bit(sequence))
+    amino_acids = _AA_LUT[codon_ids]
+
+    # Honor the early stop: translate only up to and including the
+    # first stop codon
+    stop_hits = np.flatnonzero(amino_acids == b'*')
+    if stop_hits.size:
+        amino_acids = amino_acids[:stop_hits[0] + 1]
+
+    translated = amino_acids.shape[0]
+    protein = amino_acids.tobytes().decode('ascii')
+    codons = np.frombuffer(
+        sequence.encode('ascii')[:3 * translated], dtype='S3'
+    ).astype('U3').tolist()
 
     return {
-        'protein': ''.join(protein),
+        'protein': protein,
         'codons': codons,
-        'codon_map': codon_map
+        'codon_map': [
+            {'codon': codon, 'amino_acid': amino_acid, 'position': 3 * index}
+            for index, (codon, amino_acid) in enumerate(zip(codons, protein))
+        ]
     }
 
 
+@lru_cache(maxsize=8)
+def translate_dna_cached(sequence: str) -> dict:
+    """
+    Memoized translate_dna for frame-0 translations
+
+    Callers must treat the returned dictionary as read-only; the same
+    object is shared across cache hits. The cache is kept small (a
+    translation dict is several times the sequence size, and each
+    process-pool worker holds its own copy), so it only absorbs
+    back-to-back repeats such as compare_proteins translating the same
+    reference or the UI re-analyzing one sequence.
+    """
+    return translate_dna(sequence)
+
+
 def translate_orfs(orfs: list) -> list:
     """
     Translate all ORFs to protein sequences
@@ -95,7 +119,7 @@ def translate_orfs(orfs: list) -> list:
     translated_orfs = []
 
     for orf in orfs:
-        translation = translate_dna(orf['sequence'])
+        translation = translate_dna_cached(orf['sequence'])
         translated_orf = orf.copy()
         translated_orf['translation'] = translation
         translated_orfs.append(translated_orf)
@@ -1,6 +1,11 @@
 """
 FASTA and DNA sequence validation module
 """
+import encoding
+
+_WHITESPACE_DELETE = str.maketrans('', '', ' \t\r\n\v\f')
+_WHITESPACE_BYTES = b' \t\r\n\v\f'
+
 
 def parse_fasta(fasta_text: str) -> dict:
     """
@@ -15,25 +20,29 @@ def parse_fasta(fasta_text: str) -> dict:
     Raises:
         ValueError: If FASTA format is invalid
     """
-    lines = fasta_text.strip().split('\n')
-
-    if not lines:
-        raise ValueError("Empty input")
+    text = fasta_text.strip()
 
-    if not lines[0].startswith('>'):
+    if not text.startswith('>'):
         raise ValueError("FASTA format must start with '>' character")
 
-    header = lines[0][1:].strip()
+    header_end = text.find('\n')
+    header = text[1:].strip() if header_end == -1 else text[1:header_end].strip()
 
     if not header:
         raise ValueError("FASTA header cannot be empty")
 
-    sequence_lines = [line.strip() for line in lines[1:] if line.strip()]
-
-    if not sequence_lines:
+    if header_end == -1:
         raise ValueError("No sequence found after header")
 
-    sequence = ''.join(sequence_lines).upper()
+    if text.find('>', header_end + 1) != -1:
+        raise ValueError("Multiple FASTA records found; provide a single sequence")
+
+    # Strip all whitespace from the sequence body in one C-level pass
+    # instead of stripping and joining line by line
+    sequence = text[header_end + 1:].translate(_WHITESPACE_DELETE).upper()
+
+    if not sequence:
+        raise ValueError("No sequence found after header")
 
     return {
         'header': header,
@@ -54,17 +63,69 @@ def validate_dna_sequence(sequence: str) -> bool:
     Raises:
         ValueError: If invalid characters found
     """
-    valid_chars = set('ATCG')
-    sequence_upper = sequence.upper()
-
-    invalid_chars = set(sequence_upper) - valid_chars
+    # Deleting the valid alphabet in one C call leaves only offending
+    # bytes (non-ASCII input is reported as '?')
+    invalid = sequence.upper().encode('ascii', 'replace').translate(None, b'ATCG')
 
-    if invalid_chars:
+    if invalid:
+        invalid_chars = set(invalid.decode('ascii'))
         raise ValueError(f"Invalid DNA characters found: {', '.join(sorted(invalid_chars))}")
 
     return True
 
 
+def validate_fasta_dna_bytes(data: bytes) -> dict:
+    """
+    Parse and validate FASTA format DNA directly from raw bytes
+
+    Used by the upload path so the file body never needs a full
+    str decode before parsing; only the header and the cleaned
+    sequence are decoded at the end.
+
+    Args:
+        data: raw FASTA file contents
+
+    Returns:
+        dict with header and sequence
+
+    Raises:
+        ValueError: If the FASTA format or sequence is invalid
+    """
+    text = data.strip()
+
+    if not text.startswith(b'>'):
+        raise ValueError("FASTA format must start with '>' character")
+
+    header_end = text.find(b'\n')
+    header = text[1:].strip() if header_end == -1 else text[1:header_end].strip()
+
+    if not header:
+        raise ValueError("FASTA header cannot be empty")
+
+    if header_end == -1:
+        raise ValueError("No sequence found after header")
+
+    if text.find(b'>', header_end + 1) != -1:
+        raise ValueError("Multiple FASTA records found; provide a single sequence")
+
+    sequence = text[header_end + 1:].translate(None, _WHITESPACE_BYTES).upper()
+
+    if not sequence:
+        raise ValueError("No sequence found after header")
+
+    invalid = sequence.translate(None, b'ATCG')
+    if invalid:
+        invalid_chars = set(invalid.decode('ascii', 'replace'))
+        raise ValueError(f"Invalid DNA characters found: {', '.join(sorted(invalid_chars))}")
+
+    parsed = {
+        'header': header.decode('utf-8', 'replace'),
+        'sequence': sequence.decode('ascii')
+    }
+    encoding.encode_2bit(parsed['sequence'])
+    return parsed
+
+
 def validate_fasta_dna(fasta_text: str) -> dict:
     """
     Parse and validate FASTA format DNA sequence
@@ -77,4 +138,7 @@ def validate_fasta_dna(fasta_text: str) -> dict:
     """
     parsed = parse_fasta(fasta_text)
     validate_dna_sequence(parsed['sequence'])
+    # Warm the shared 2-bit encoding so downstream analysis and
+    # translation reuse one encoding pass instead of re-scanning
+    encoding.encode_2bit(parsed['sequence'])
     return parsed
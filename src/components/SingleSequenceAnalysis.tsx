@@ -54,7 +54,7 @@ export default function SingleSequenceAnalysis() {
     setLoading(true);
 
     try {
-      const response = await fetch(`${API_URL}/analyze`, {
+      const response = await fetch(`${API_URL}/analyze?include=all`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',